@@ -7,8 +7,16 @@ import urllib.parse
 import os
 import re
 import json
+import signal
+import time
+
+# A cancel lets the page in flight run to its PAGE_DEADLINE (90s) and be parsed,
+# so the grace period has to cover a full page plus parsing and driver.quit()
+CANCEL_GRACE_PERIOD = 180
+TERMINATE_GRACE_PERIOD = 5
 
 scraper_process = None
+driver_pid = None
 all_results = []
 stats = {
     'products_found': 0,
@@ -20,11 +28,13 @@ stats = {
 
 
 def run_script():
-    global scraper_process, all_results, stats
+    global scraper_process, driver_pid, all_results, stats
     query = query_entry.get().strip()
     brand = brand_entry.get().strip()
     start_page = start_page_entry.get().strip() or "1"
     end_page = end_page_entry.get().strip() or "3"
+    tabs = tabs_entry.get().strip() or "1"
+    run_budget = budget_entry.get().strip() or "0"
 
     if not query or not brand:
         messagebox.showerror("Input Error", "Please enter a search query and target brand")
@@ -33,19 +43,29 @@ def run_script():
     try:
         start_page_int = int(start_page)
         end_page_int = int(end_page)
+        tabs_int = int(tabs)
+        run_budget_int = int(run_budget)
         if start_page_int > end_page_int:
             messagebox.showerror("Input Error", "Start page cannot be greater than end page")
             return
+        if tabs_int < 1:
+            messagebox.showerror("Input Error", "Tabs must be at least 1")
+            return
+        if run_budget_int < 0:
+            messagebox.showerror("Input Error", "Run budget cannot be negative")
+            return
     except ValueError:
-        messagebox.showerror("Input Error", "Start Page and End Page must be integers")
+        messagebox.showerror("Input Error", "Start Page, End Page, Tabs and Run Budget must be integers")
         return
 
     run_button.config(state=tk.DISABLED, text="Running…", bg="#388E3C")
     exit_button.config(state=tk.NORMAL)
+    stop_button.config(state=tk.NORMAL, text="⏹ Stop")
     result_text.delete(1.0, tk.END)
     for item in results_table.get_children():
         results_table.delete(item)
     all_results.clear()
+    driver_pid = None
 
     stats.update({'products_found':0,'pages_processed':0,'total_price':0,'price_count':0,'average_price':0})
     update_stats()
@@ -55,19 +75,21 @@ def run_script():
     search_url = f"https://www.wildberries.ru/catalog/0/search.aspx?search={encoded_query}"
     url_label.config(text=f"Search URL: {search_url}")
 
-    thread = threading.Thread(target=execute_script, args=(search_url, brand, start_page_int, end_page_int))
+    thread = threading.Thread(target=execute_script, args=(search_url, brand, start_page_int, end_page_int, tabs_int, run_budget_int))
     thread.daemon = True
     thread.start()
 
-def execute_script(search_url, target_brand, start_page, end_page):
+def execute_script(search_url, target_brand, start_page, end_page, tabs, run_budget):
     global scraper_process, all_results, stats
     try:
         scraper_process = subprocess.Popen(
-            [sys.executable, "-u", "wildberries_scraper.py", search_url, target_brand, str(start_page), str(end_page)],
+            [sys.executable, "-u", "wildberries_scraper.py", search_url, target_brand, str(start_page), str(end_page), str(tabs), str(run_budget)],
+            stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             universal_newlines=True,
-            cwd=os.path.dirname(os.path.abspath(__file__))
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            start_new_session=(os.name != 'nt')
         )
         for line in scraper_process.stdout:
             root.after(0, append_text, line)
@@ -106,11 +128,54 @@ def append_text(text):
 
 def reset_ui():
     run_button.config(state=tk.NORMAL, text="Check Rankings", bg="#4CAF50")
+    stop_button.config(state=tk.DISABLED, text="⏹ Stop")
+
+def request_cancel(process):
+    # The scraper finishes its current page, prints a partial summary and quits Chrome
+    try:
+        process.stdin.write("cancel\n")
+        process.stdin.flush()
+    except Exception:
+        pass
+
+def kill_process_tree(process):
+    # Last resort: take chromedriver and Chrome down together with the scraper.
+    # chromedriver runs in its own process group, so it is killed by its own PID.
+    for pid in (process.pid, driver_pid):
+        if not pid:
+            continue
+        try:
+            if os.name == 'nt':
+                subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)], capture_output=True)
+            else:
+                os.killpg(pid, signal.SIGKILL)
+        except Exception:
+            pass
+
+def stop_scraper():
+    process = scraper_process
+    if process and process.poll() is None:
+        request_cancel(process)
+        stop_button.config(state=tk.DISABLED, text="Stopping…")
 
 def exit_app():
-    global scraper_process
-    if scraper_process and scraper_process.poll() is None:
-        try: scraper_process.terminate()
+    process = scraper_process
+    if not process or process.poll() is not None:
+        root.destroy()
+        return
+    request_cancel(process)
+    run_button.config(state=tk.DISABLED)
+    stop_button.config(state=tk.DISABLED, text="Stopping…")
+    exit_button.config(state=tk.DISABLED, text="Exiting…")
+    wait_for_exit(process, time.monotonic() + CANCEL_GRACE_PERIOD)
+
+def wait_for_exit(process, deadline):
+    if process.poll() is None and time.monotonic() < deadline:
+        root.after(500, wait_for_exit, process, deadline)
+        return
+    if process.poll() is None:
+        kill_process_tree(process)
+        try: process.wait(timeout=TERMINATE_GRACE_PERIOD)
         except Exception: pass
     root.destroy()
 
@@ -136,7 +201,7 @@ def clear_results():
     update_stats()
 
 def extract_stats(line):
-    global all_results, stats
+    global all_results, stats, driver_pid
     all_results.append(line.strip())
     line = line.strip()
     try:
@@ -159,6 +224,8 @@ def extract_stats(line):
                     stats['price_count'] +=1
                     stats['average_price'] = round(stats['total_price']/stats['price_count'])
                     update_stats()
+            elif type_ == 'driver_started':
+                driver_pid = data.get('pid')
             elif type_ in ['page_complete','summary']:
                 page_num = data.get('page', data.get('pages_processed',0))
                 if page_num > stats['pages_processed']:
@@ -222,6 +289,14 @@ tk.Label(page_frame, text="End Page:", bg="#ffffff").pack(side=tk.LEFT, padx=(20
 end_page_entry = tk.Entry(page_frame, width=5)
 end_page_entry.pack(side=tk.LEFT)
 end_page_entry.insert(0,"3")
+tk.Label(page_frame, text="Tabs:", bg="#ffffff").pack(side=tk.LEFT, padx=(20,5))
+tabs_entry = tk.Entry(page_frame, width=5)
+tabs_entry.pack(side=tk.LEFT)
+tabs_entry.insert(0,"1")
+tk.Label(page_frame, text="Run Budget (s, 0 = none):", bg="#ffffff").pack(side=tk.LEFT, padx=(20,5))
+budget_entry = tk.Entry(page_frame, width=6)
+budget_entry.pack(side=tk.LEFT)
+budget_entry.insert(0,"0")
 
 url_label = tk.Label(input_panel, text="Search URL will appear here", fg="#1976D2", bg="#ffffff", wraplength=850, font=("Segoe UI", 9))
 url_label.pack(pady=5, anchor=tk.W)
@@ -277,5 +352,8 @@ clear_button = tk.Button(buttons_frame, text="🧹 Clear Results", command=clear
 clear_button.pack(side=tk.LEFT, padx=5)
 exit_button = tk.Button(buttons_frame, text="❌ Exit", command=exit_app, bg="#f44336", fg="white", font=("Segoe UI",10,"bold"), padx=10, pady=5)
 exit_button.pack(side=tk.LEFT, padx=5)
+stop_button = tk.Button(buttons_frame, text="⏹ Stop", command=stop_scraper, state=tk.DISABLED, bg="#795548", fg="white", font=("Segoe UI",10,"bold"), padx=10, pady=5)
+stop_button.pack(side=tk.LEFT, padx=5)
 
+root.protocol("WM_DELETE_WINDOW", exit_app)
 root.mainloop()
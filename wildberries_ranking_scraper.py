@@ -1,13 +1,19 @@
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, NoSuchElementException, WebDriverException
+import os
+import subprocess
 import time
 import random
 import re
 import sys
 import json
+import heapq
+import signal
+import statistics
+import threading
 
 MAIN_PRODUCTS_SELECTOR = "div.product-card-list > article.product-card"
 RECOMMENDED_SECTION_SELECTOR = "section.j-b-recommended-goods-wrapper"
@@ -22,12 +28,28 @@ SCROLL_PAUSE_MAX = 3.0
 MAX_SCROLLS = 60
 SCROLL_INCREMENT = 600
 LOAD_TIMEOUT = 40
+MIN_LOAD_TIMEOUT = 10
+LOAD_TIMEOUT_PERCENTILE = 95
+LOAD_TIMEOUT_MULTIPLIER = 2.0
+MIN_LATENCY_SAMPLES = 3
 INITIAL_LOAD_WAIT = 5
 
+PAGE_DEADLINE = 90
+PAGE_RETRIES = 1
+
 ROW_TOLERANCE = 10
 
-def start_driver():
+MAX_TABS = 4
+TAB_POLL_INTERVAL = 0.5
+
+page_load_latencies = []
+cancel_requested = threading.Event()
+cancel_announced = False
+
+def start_driver(background_tabs=False):
     options = webdriver.ChromeOptions()
+    # Navigation never blocks on the load event; every wait polls for products instead
+    options.page_load_strategy = 'none'
     options.add_argument("--start-maximized")
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -35,17 +57,81 @@ def start_driver():
     options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                          "AppleWebKit/537.36 (KHTML, like Gecko) "
                          "Chrome/126.0.0.0 Safari/537.36")
-    driver = webdriver.Chrome(options=options)
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    if background_tabs:
+        # Each "tab" is its own window (see open_tabs). Windows covered by another
+        # window must not be treated as hidden, or they stop lazy-loading products.
+        options.add_argument("--disable-background-timer-throttling")
+        options.add_argument("--disable-backgrounding-occluded-windows")
+        options.add_argument("--disable-renderer-backgrounding")
+    driver = webdriver.Chrome(options=options, service=driver_service())
+    try:
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    except Exception:
+        driver.quit()
+        raise
     return driver
 
-def human_like_scroll(driver, scroll_count):
+def driver_service():
+    # chromedriver (and the Chrome it spawns) gets its own process group, so a
+    # terminal Ctrl+C only reaches this script and the cancel path can still use it
+    if os.name == 'nt':
+        return Service(creation_flags=subprocess.CREATE_NEW_PROCESS_GROUP)
+    return Service(popen_kw={"start_new_session": True})
+
+def request_cancel(signum=None, frame=None):
+    # Runs in signal handlers and the stdin thread, so it must not print:
+    # output from here could split another JSON line or re-enter print()
+    if cancel_requested.is_set() and signum == signal.SIGINT:
+        raise KeyboardInterrupt
+    cancel_requested.set()
+
+def announce_cancel():
+    global cancel_announced
+    if cancel_requested.is_set() and not cancel_announced:
+        cancel_announced = True
+        print(json.dumps({
+            "type": "warning",
+            "message": "Cancel requested. Finishing current page..."
+        }), flush=True)
+
+def listen_for_cancel():
+    # The GUI writes "cancel" to stdin; a terminal user can press Ctrl+C once.
+    # A second Ctrl+C aborts immediately, the driver is still quit in main().
+    def read_stdin():
+        try:
+            for line in sys.stdin:
+                if line.strip().lower() == "cancel":
+                    request_cancel()
+        except Exception:
+            pass
+
+    threading.Thread(target=read_stdin, daemon=True).start()
+    signal.signal(signal.SIGINT, request_cancel)
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, request_cancel)
+
+def adaptive_load_timeout():
+    # Until enough pages have been seen, fall back to the fixed LOAD_TIMEOUT
+    if len(page_load_latencies) < MIN_LATENCY_SAMPLES:
+        return LOAD_TIMEOUT
+    percentiles = statistics.quantiles(page_load_latencies, n=100, method='inclusive')
+    observed = percentiles[LOAD_TIMEOUT_PERCENTILE - 1]
+    return max(MIN_LOAD_TIMEOUT, min(LOAD_TIMEOUT, observed * LOAD_TIMEOUT_MULTIPLIER))
+
+def time_left(deadline):
+    if deadline is None:
+        return float('inf')
+    return max(0, deadline - time.monotonic())
+
+def wait_timeout(deadline):
+    return min(adaptive_load_timeout(), time_left(deadline))
+
+def scroll_pause_for(scroll_count):
     if scroll_count < 3:
-        scroll_pause = random.uniform(SCROLL_PAUSE_MIN * 1.5, SCROLL_PAUSE_MAX * 1.5)
-    else:
-        scroll_pause = random.uniform(SCROLL_PAUSE_MIN, SCROLL_PAUSE_MAX)
-    
-    time.sleep(scroll_pause)
+        return random.uniform(SCROLL_PAUSE_MIN * 1.5, SCROLL_PAUSE_MAX * 1.5)
+    return random.uniform(SCROLL_PAUSE_MIN, SCROLL_PAUSE_MAX)
+
+def scroll_page(driver, scroll_count):
     current_position = driver.execute_script("return window.pageYOffset;")
     window_height = driver.execute_script("return window.innerHeight;")
     
@@ -55,7 +141,6 @@ def human_like_scroll(driver, scroll_count):
         scroll_to = current_position + random.randint(SCROLL_INCREMENT, window_height)
     
     driver.execute_script(f"window.scrollTo(0, {scroll_to});")
-    return scroll_pause
 
 def is_loading_finished(driver, previous_count, current_count, stable_count, scroll_count):
     if current_count == previous_count:
@@ -66,18 +151,67 @@ def is_loading_finished(driver, previous_count, current_count, stable_count, scr
         return 3
     return 0
 
-def load_main_products(driver, url, is_first_page=False):
-    driver.get(url)
-    wait = WebDriverWait(driver, LOAD_TIMEOUT)
+def poll_until(driver, condition, timeout, message, cancellable=False):
+    # Polls like WebDriverWait, but yields the poll interval instead of sleeping
+    # so the caller decides whether to sleep or to work on another tab meanwhile.
+    # Only waits between pages are cancellable; a page in flight runs to its deadline.
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = condition(driver)
+        except (StaleElementReferenceException, WebDriverException):
+            result = None
+        if result:
+            return result
+        if time.monotonic() >= deadline or (cancellable and cancel_requested.is_set()):
+            raise TimeoutException(f"{message} within {timeout:.0f} seconds")
+        yield TAB_POLL_INTERVAL
+
+def wait_for_main_products(driver, timeout, visible=False, cancellable=False):
+    locator = (By.CSS_SELECTOR, MAIN_PRODUCTS_SELECTOR)
+    if visible:
+        condition = EC.visibility_of_any_elements_located(locator)
+    else:
+        condition = EC.presence_of_all_elements_located(locator)
+    return (yield from poll_until(driver, condition, timeout, "Main products not found", cancellable))
+
+def start_navigation(driver, url):
+    # The marker lives on the old document, so it disappears once the new one is in
+    driver.execute_script("window.__wbPendingNavigation = true; window.location.href = arguments[0];", url)
+
+def navigation_committed(driver):
+    return driver.execute_script("return window.__wbPendingNavigation === undefined;")
+
+def wait_for_navigation(driver, timeout, cancellable=False):
+    return (yield from poll_until(driver, navigation_committed, timeout, "Page did not start loading", cancellable))
+
+def load_main_products_steps(driver, url, is_first_page=False, page=None, deadline=None):
+    # Navigation only starts here; the network-bound load happens while the
+    # scheduler works on other tabs and this one polls for the new document.
+    # The sample and the timeout use the same wall clock, from start_navigation to
+    # the first products, so in tab mode both include time spent on other tabs.
+    load_timeout = wait_timeout(deadline)
+    started = time.monotonic()
+    load_deadline = started + load_timeout
+    start_navigation(driver, url)
     
+    try:
+        yield from wait_for_navigation(driver, time_left(load_deadline))
+        yield from wait_for_main_products(driver, time_left(load_deadline))
+        page_load_latencies.append(time.monotonic() - started)
+    except TimeoutException:
+        # Censored sample: the load took at least this long
+        page_load_latencies.append(load_timeout)
+        # Scrolling an empty page only burns its deadline; let load_page_steps retry it
+        print(json.dumps({"type": "warning", "message": f"No main products found on page {page} within timeout period."}), flush=True)
+        return []
+
     if is_first_page:
-        time.sleep(INITIAL_LOAD_WAIT)
-    
+        yield INITIAL_LOAD_WAIT
     try:
-        wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, MAIN_PRODUCTS_SELECTOR)))
-        wait.until(EC.visibility_of_any_elements_located((By.CSS_SELECTOR, MAIN_PRODUCTS_SELECTOR)))
+        yield from wait_for_main_products(driver, wait_timeout(deadline), visible=True)
     except TimeoutException:
-        print(json.dumps({"type": "warning", "message": "No main products found within timeout period. Continuing anyway."}), flush=True)
+        print(json.dumps({"type": "warning", "message": "No visible main products within timeout period. Continuing anyway."}), flush=True)
 
     print(json.dumps({"type": "info", "message": "Page loaded. Scrolling to load all main products..."}), flush=True)
 
@@ -86,13 +220,29 @@ def load_main_products(driver, url, is_first_page=False):
     max_stable_checks = 2
 
     for i in range(MAX_SCROLLS):
-        pause_time = human_like_scroll(driver, i)
-        time.sleep(0.5)
+        if time_left(deadline) <= 0:
+            print(json.dumps({
+                "type": "warning",
+                "message": f"Page {page} deadline reached. Stopping scroll."
+            }), flush=True)
+            break
+        pause_time = min(scroll_pause_for(i), time_left(deadline))
+        yield pause_time
+        try:
+            scroll_page(driver, i)
+        except Exception as e:
+            print(json.dumps({
+                "type": "error",
+                "message": f"Error during scroll {i+1}: {str(e)}"
+            }), flush=True)
+            continue
+        yield 0.5
         try:
             main_products = driver.find_elements(By.CSS_SELECTOR, MAIN_PRODUCTS_SELECTOR)
             current_count = len(main_products)
             print(json.dumps({
                 "type": "scroll_progress",
+                "page": page,
                 "scroll": i+1,
                 "total_scrolls": MAX_SCROLLS,
                 "product_count": current_count,
@@ -114,9 +264,9 @@ def load_main_products(driver, url, is_first_page=False):
             }), flush=True)
             continue
 
-    time.sleep(2)
+    yield min(2, time_left(deadline))
     try:
-        main_products = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, MAIN_PRODUCTS_SELECTOR)))
+        main_products = yield from wait_for_main_products(driver, wait_timeout(deadline))
         print(json.dumps({
             "type": "info",
             "message": f"Final main product count: {len(main_products)}"
@@ -137,6 +287,87 @@ def load_main_products(driver, url, is_first_page=False):
         except:
             return []
 
+def load_page_steps(driver, url, is_first_page=False, page=None, run_deadline=None):
+    # Each attempt stops scrolling at its PAGE_DEADLINE and keeps what loaded by then.
+    # An attempt that comes back empty gives up after one load timeout, so a bad
+    # page is retried while the run budget allows and then skipped.
+    # Returns (main_products, loaded); loaded is False for a skipped page.
+    for attempt in range(PAGE_RETRIES + 1):
+        if cancel_requested.is_set() or time_left(run_deadline) <= 0:
+            return [], False
+        if attempt:
+            print(json.dumps({
+                "type": "warning",
+                "message": f"Page {page} returned no products. Retrying..."
+            }), flush=True)
+        deadline = time.monotonic() + PAGE_DEADLINE
+        if run_deadline is not None:
+            deadline = min(deadline, run_deadline)
+        main_products = yield from load_main_products_steps(
+            driver, url, is_first_page and attempt == 0, page, deadline
+        )
+        if main_products:
+            return main_products, True
+
+    print(json.dumps({
+        "type": "warning",
+        "message": f"Skipping page {page}: no products after {PAGE_RETRIES + 1} attempts."
+    }), flush=True)
+    return [], False
+
+def run_steps(steps):
+    try:
+        while True:
+            time.sleep(next(steps))
+            announce_cancel()
+    except StopIteration as stop:
+        return stop.value
+
+def load_main_products(driver, url, is_first_page=False, page=None, run_deadline=None):
+    return run_steps(load_page_steps(driver, url, is_first_page, page, run_deadline))
+
+def open_tabs(driver, count):
+    # A background tab is document.hidden: it is not rendered, so scroll events and
+    # IntersectionObserver callbacks never fire and lazy loading stalls. A separate
+    # window in the same browser stays visible and still shares one Chrome.
+    handles = [driver.current_window_handle]
+    for _ in range(count - 1):
+        driver.switch_to.new_window('window')
+        handles.append(driver.current_window_handle)
+    return handles
+
+def load_pages_in_tabs(driver, tab_handles, page_urls, pages, is_first_batch=False, run_deadline=None):
+    # Each tab runs its own load_main_products_steps; whichever tab wakes up
+    # first gets the driver, so one tab's scroll pause is spent on the others.
+    results = [([], False) for _ in page_urls]
+    schedule = []
+    for idx, (url, page) in enumerate(zip(page_urls, pages)):
+        steps = load_page_steps(driver, url, is_first_batch, page, run_deadline)
+        heapq.heappush(schedule, (0, idx, steps))
+
+    while schedule:
+        wake_at, idx, steps = heapq.heappop(schedule)
+        delay = wake_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        announce_cancel()
+        try:
+            driver.switch_to.window(tab_handles[idx])
+            pause = next(steps)
+        except StopIteration as stop:
+            results[idx] = stop.value
+            continue
+        except WebDriverException as e:
+            # One broken window (e.g. a crashed renderer) must not cost the others their pages
+            print(json.dumps({
+                "type": "warning",
+                "message": f"Window for page {pages[idx]} failed: {str(e)}"
+            }), flush=True)
+            steps.close()
+            continue
+        heapq.heappush(schedule, (time.monotonic() + pause, idx, steps))
+    return results
+
 def sort_products_grid(products):
     positioned = []
     for idx, p in enumerate(products):
@@ -182,7 +413,13 @@ def parse_product(card):
             return "", "", "N/A", None
     return "", "", "N/A", None
 
-def go_to_next_page(driver, current_page):
+def navigation_allowed(run_deadline):
+    return not cancel_requested.is_set() and time_left(run_deadline) > 0
+
+def go_to_next_page(driver, current_page, run_deadline=None):
+    # Every wait here is bounded by the run budget and returns early on cancel
+    if not navigation_allowed(run_deadline):
+        return False
     try:
         next_button = driver.find_element(By.CSS_SELECTOR, NEXT_PAGE_SELECTOR)
         if next_button.is_enabled():
@@ -192,10 +429,8 @@ def go_to_next_page(driver, current_page):
                 "message": f"Navigating to page {current_page + 1}...",
                 "page": current_page + 1
             }), flush=True)
-            WebDriverWait(driver, LOAD_TIMEOUT).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, MAIN_PRODUCTS_SELECTOR))
-            )
-            time.sleep(2)
+            run_steps(wait_for_main_products(driver, wait_timeout(run_deadline), cancellable=True))
+            cancel_requested.wait(min(2, time_left(run_deadline)))
             return True
     except Exception as e:
         print(json.dumps({
@@ -203,6 +438,8 @@ def go_to_next_page(driver, current_page):
             "message": f"Could not navigate to next page using button: {str(e)}"
         }), flush=True)
 
+    if not navigation_allowed(run_deadline):
+        return False
     try:
         current_url = driver.current_url
         if 'page=' in current_url:
@@ -210,16 +447,16 @@ def go_to_next_page(driver, current_page):
         else:
             separator = '&' if '?' in current_url else '?'
             next_url = f"{current_url}{separator}page={current_page + 1}"
-        driver.get(next_url)
+        start_navigation(driver, next_url)
         print(json.dumps({
             "type": "navigation",
             "message": f"Navigating to page {current_page + 1} via URL...",
             "page": current_page + 1
         }), flush=True)
-        WebDriverWait(driver, LOAD_TIMEOUT).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, MAIN_PRODUCTS_SELECTOR))
-        )
-        time.sleep(2)
+        load_deadline = time.monotonic() + wait_timeout(run_deadline)
+        run_steps(wait_for_navigation(driver, time_left(load_deadline), cancellable=True))
+        run_steps(wait_for_main_products(driver, time_left(load_deadline), cancellable=True))
+        cancel_requested.wait(min(2, time_left(run_deadline)))
         return True
     except Exception as e:
         print(json.dumps({
@@ -236,11 +473,101 @@ def clean_text(text):
         text = text.replace(old, new)
     return text
 
+def build_page_url(base_url, page):
+    if page <= 1:
+        return base_url
+    separator = '&' if '?' in base_url else '?'
+    return f"{base_url}{separator}page={page}"
+
+def process_page(main_products, current_page, target_brand, global_position):
+    print(json.dumps({
+        "type": "page_analysis",
+        "page": current_page,
+        "product_count": len(main_products)
+    }), flush=True)
+
+    page_found_products = []
+    sorted_main_products = sort_products_grid(main_products)
+
+    for index, card in enumerate(sorted_main_products):
+        global_position += 1
+        try:
+            brand, name, price, price_numeric = parse_product(card)
+            if brand and brand.lower() == target_brand.lower():
+                product_info = {
+                    "global_position": global_position,
+                    "brand": clean_text(brand),
+                    "name": clean_text(name),
+                    "price_text": clean_text(price),
+                    "price_numeric": price_numeric,
+                    "page": current_page
+                }
+                page_found_products.append(product_info)
+                
+                print(json.dumps({
+                    "type": "product_found",
+                    "product": product_info
+                }), flush=True)
+                
+            if (index + 1) % 15 == 0:
+                print(json.dumps({
+                    "type": "progress",
+                    "processed": index + 1,
+                    "total": len(main_products),
+                    "page": current_page
+                }), flush=True)
+        except Exception as e:
+            print(json.dumps({
+                "type": "error",
+                "message": f"Error processing product {index + 1} on page {current_page}: {str(e)}"
+            }), flush=True)
+            continue
+
+    print(json.dumps({
+        "type": "page_complete",
+        "page": current_page,
+        "products_found": len(page_found_products),
+        "products_on_page": len(main_products)
+    }), flush=True)
+
+    return page_found_products, global_position
+
+def wait_before_next_page():
+    wait_time = random.uniform(3.0, 5.0)
+    print(json.dumps({
+        "type": "info",
+        "message": f"Waiting {wait_time:.1f} seconds before next page..."
+    }), flush=True)
+    cancel_requested.wait(wait_time)
+
+def skip_page(page):
+    print(json.dumps({
+        "type": "page_skipped",
+        "page": page,
+        "message": f"Page {page} was not loaded and is left out of the results."
+    }), flush=True)
+
+def should_stop(run_deadline):
+    announce_cancel()
+    if cancel_requested.is_set():
+        print(json.dumps({
+            "type": "warning",
+            "message": "Run cancelled. Skipping remaining pages."
+        }), flush=True)
+        return True
+    if time_left(run_deadline) <= 0:
+        print(json.dumps({
+            "type": "warning",
+            "message": "Run budget exhausted. Skipping remaining pages."
+        }), flush=True)
+        return True
+    return False
+
 def main():
-    if len(sys.argv) < 4:
+    if len(sys.argv) < 5:
         print(json.dumps({
             "type": "error",
-            "message": "Usage: python wildberries_scraper.py <search_url> <target_brand> <start_page> <end_page>"
+            "message": "Usage: python wildberries_scraper.py <search_url> <target_brand> <start_page> <end_page> [tabs] [run_budget_seconds]"
         }), flush=True)
         sys.exit(1)
 
@@ -248,9 +575,13 @@ def main():
     TARGET_BRAND = sys.argv[2]
     start_page = int(sys.argv[3])
     end_page = int(sys.argv[4])
+    tabs = int(sys.argv[5]) if len(sys.argv) > 5 else 1
+    run_budget = float(sys.argv[6]) if len(sys.argv) > 6 else 0
+    run_deadline = time.monotonic() + run_budget if run_budget > 0 else None
     
     global MAX_PAGES
     MAX_PAGES = end_page - start_page + 1
+    tabs = max(1, min(tabs, MAX_TABS, MAX_PAGES))
 
     print(json.dumps({
         "type": "config",
@@ -258,110 +589,121 @@ def main():
         "search_url": BASE_URL,
         "start_page": start_page,
         "end_page": end_page,
-        "pages_to_process": MAX_PAGES
+        "pages_to_process": MAX_PAGES,
+        "tabs": tabs,
+        "run_budget": run_budget or None,
+        "page_deadline": PAGE_DEADLINE
     }), flush=True)
 
-    driver = start_driver()
+    listen_for_cancel()
+    driver = start_driver(background_tabs=tabs > 1)
+    # The GUI needs this PID to kill chromedriver if the scraper itself hangs
+    print(json.dumps({
+        "type": "driver_started",
+        "pid": driver.service.process.pid,
+        "message": "Driver started."
+    }), flush=True)
     all_found_products = []
     total_products_analyzed = 0
+    pages_processed = 0
+    skipped_pages = []
+    ranks_incomplete = False
     current_page = start_page
     global_position = 0
 
     try:
         page_count = 0
-        while current_page <= end_page:  
-            page_count += 1
-            is_first_page = (page_count == 1)
-            
-            print(json.dumps({
-                "type": "page_start",
-                "page": current_page,
-                "end_page": end_page,
-                "is_first_page": is_first_page
-            }), flush=True)
-
-            page_url = BASE_URL
-            if current_page > 1:
-                separator = '&' if '?' in BASE_URL else '?'
-                page_url = f"{BASE_URL}{separator}page={current_page}"
-
-            main_products = load_main_products(driver, page_url, is_first_page)
-            total_products_analyzed += len(main_products)
-            print(json.dumps({
-                "type": "page_analysis",
-                "page": current_page,
-                "product_count": len(main_products)
-            }), flush=True)
-
-            page_found_products = []
-            sorted_main_products = sort_products_grid(main_products)
-
-            for index, card in enumerate(sorted_main_products):
-                global_position += 1
-                try:
-                    brand, name, price, price_numeric = parse_product(card)
-                    if brand and brand.lower() == TARGET_BRAND.lower():
-                        product_info = {
-                            "global_position": global_position,
-                            "brand": clean_text(brand),
-                            "name": clean_text(name),
-                            "price_text": clean_text(price),
-                            "price_numeric": price_numeric,
-                            "page": current_page
-                        }
-                        page_found_products.append(product_info)
-                        
-                        print(json.dumps({
-                            "type": "product_found",
-                            "product": product_info
-                        }), flush=True)
-                        
-                    if (index + 1) % 15 == 0:
-                        print(json.dumps({
-                            "type": "progress",
-                            "processed": index + 1,
-                            "total": len(main_products),
-                            "page": current_page
-                        }), flush=True)
-                except Exception as e:
+        if tabs > 1:
+            tab_handles = open_tabs(driver, tabs)
+            while not (page_count and should_stop(run_deadline)):
+                batch_pages = list(range(current_page, min(current_page + tabs, end_page + 1)))
+                is_first_batch = (page_count == 0)
+                page_count += len(batch_pages)
+
+                for page in batch_pages:
                     print(json.dumps({
-                        "type": "error",
-                        "message": f"Error processing product {index + 1} on page {current_page}: {str(e)}"
+                        "type": "page_start",
+                        "page": page,
+                        "end_page": end_page,
+                        "is_first_page": is_first_batch and page == batch_pages[0]
                     }), flush=True)
-                    continue
-
-            all_found_products.extend(page_found_products)
-
-            print(json.dumps({
-                "type": "page_complete",
-                "page": current_page,
-                "products_found": len(page_found_products),
-                "products_on_page": len(main_products)
-            }), flush=True)
 
-            if current_page < end_page: 
-                if not go_to_next_page(driver, current_page):
-                    print(json.dumps({
-                        "type": "error",
-                        "message": "Failed to navigate to next page. Ending pagination."
-                    }), flush=True)
+                batch_products = load_pages_in_tabs(
+                    driver, tab_handles,
+                    [build_page_url(BASE_URL, page) for page in batch_pages],
+                    batch_pages, is_first_batch, run_deadline
+                )
+
+                for idx, (page, (main_products, loaded)) in enumerate(zip(batch_pages, batch_products)):
+                    if not loaded:
+                        skip_page(page)
+                        skipped_pages.append(page)
+                        continue
+                    # Positions after a skipped page are short by its products
+                    ranks_incomplete = ranks_incomplete or bool(skipped_pages)
+                    # Card elements belong to their own tab, so parse them from there
+                    driver.switch_to.window(tab_handles[idx])
+                    total_products_analyzed += len(main_products)
+                    page_found_products, global_position = process_page(
+                        main_products, page, TARGET_BRAND, global_position
+                    )
+                    all_found_products.extend(page_found_products)
+                    pages_processed += 1
+
+                current_page = batch_pages[-1]
+                if current_page >= end_page or should_stop(run_deadline):
                     break
                 current_page += 1
-                wait_time = random.uniform(3.0, 5.0)
+                wait_before_next_page()
+
+        else:
+            while current_page <= end_page and not (page_count and should_stop(run_deadline)):
+                page_count += 1
+                is_first_page = (page_count == 1)
+            
                 print(json.dumps({
-                    "type": "info",
-                    "message": f"Waiting {wait_time:.1f} seconds before next page..."
+                    "type": "page_start",
+                    "page": current_page,
+                    "end_page": end_page,
+                    "is_first_page": is_first_page
                 }), flush=True)
-                time.sleep(wait_time)
-            else:
-                break
+
+                page_url = build_page_url(BASE_URL, current_page)
+                main_products, loaded = load_main_products(driver, page_url, is_first_page, current_page, run_deadline)
+                if loaded:
+                    ranks_incomplete = ranks_incomplete or bool(skipped_pages)
+                    total_products_analyzed += len(main_products)
+                    page_found_products, global_position = process_page(
+                        main_products, current_page, TARGET_BRAND, global_position
+                    )
+                    all_found_products.extend(page_found_products)
+                    pages_processed += 1
+                else:
+                    skip_page(current_page)
+                    skipped_pages.append(current_page)
+
+                if current_page >= end_page or should_stop(run_deadline):
+                    break
+                if not go_to_next_page(driver, current_page, run_deadline):
+                    if not should_stop(run_deadline):
+                        print(json.dumps({
+                            "type": "error",
+                            "message": "Failed to navigate to next page. Ending pagination."
+                        }), flush=True)
+                    break
+                current_page += 1
+                wait_before_next_page()
 
         print(json.dumps({
             "type": "summary",
             "target_brand": clean_text(TARGET_BRAND),
-            "pages_processed": current_page - start_page + 1,
+            "pages_processed": pages_processed,
             "total_products_analyzed": total_products_analyzed,
-            "target_brand_products_found": len(all_found_products)
+            "target_brand_products_found": len(all_found_products),
+            "pages_skipped": skipped_pages,
+            "ranks_incomplete": ranks_incomplete,
+            "cancelled": cancel_requested.is_set(),
+            "partial": pages_processed < MAX_PAGES
         }), flush=True)
 
         if all_found_products:
@@ -376,7 +718,7 @@ def main():
         else:
             print(json.dumps({
                 "type": "no_results",
-                "message": f"No products found for brand '{clean_text(TARGET_BRAND)}' across {current_page - start_page + 1} pages."
+                "message": f"No products found for brand '{clean_text(TARGET_BRAND)}' across {pages_processed} pages."
             }), flush=True)
 
     except Exception as e:
@@ -388,12 +730,19 @@ def main():
         traceback.print_exc()
 
     finally:
-        time.sleep(1)
-        driver.quit()
-        print(json.dumps({
-            "type": "info",
-            "message": "Driver closed."
-        }), flush=True)
+        # Once shutdown starts a further Ctrl+C must not interrupt driver.quit()
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        try:
+            driver.quit()
+            print(json.dumps({
+                "type": "info",
+                "message": "Driver closed."
+            }), flush=True)
+        except Exception as e:
+            print(json.dumps({
+                "type": "error",
+                "message": f"Could not close driver cleanly: {str(e)}"
+            }), flush=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file